@@ -1,17 +1,38 @@
-from typing import Optional
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+import hashlib
+import time
+import uuid
+from datetime import timedelta
+from typing import Optional, Tuple
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, Request, status
 
-from app.core.security import decode_access_token
+from app.core.config import settings
+from app.core.security import create_access_token, decode_access_token
+from app.db.sessions import create_session, get_session
 from app.models.user import User, TokenData
 
-# Security scheme
-security = HTTPBearer()
+# Authenticated users keyed by token digest -> (user, jti, token expiry timestamp)
+_USER_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=60)
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security)
-) -> User:
-    """Dependency to get current authenticated user"""
+def _token_key(token: str) -> bytes:
+    """Short fixed-size cache key for a token"""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+def invalidate_token(token: str) -> None:
+    """Drop a token's cached user so the next request re-validates it"""
+    _USER_CACHE.pop(_token_key(token), None)
+
+async def issue_access_token(user: User, expires_delta: Optional[timedelta] = None) -> str:
+    """Create an access token for a user and register it as an active session"""
+    if expires_delta is None:
+        expires_delta = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    jti = uuid.uuid4().hex
+    token = create_access_token(data={"sub": user.email, "jti": jti}, expires_delta=expires_delta)
+    await create_session(jti, user.id_str, int(expires_delta.total_seconds()))
+    return token
+
+async def authenticate_token(token: str) -> Tuple[User, str]:
+    """Resolve a bearer token to its active user and session id (used by AuthMiddleware)"""
     
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -19,19 +40,33 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
+    # Repeat requests with the same token skip JWT verification and the DB lookup,
+    # but the session is always checked so logout takes effect immediately
+    key = _token_key(token)
+    cached = _USER_CACHE.get(key)
+    if cached is not None:
+        user, jti, expires_at = cached
+        if time.time() < expires_at and await get_session(jti) is not None:
+            return user, jti
+        _USER_CACHE.pop(key, None)
+    
     # Decode token
-    token = credentials.credentials
     payload = decode_access_token(token)
     
     if payload is None:
         raise credentials_exception
     
-    email: str = payload.get("sub")
-    if email is None:
+    jti: str = payload.get("jti")
+    if jti is None:
+        raise credentials_exception
+    
+    # Session lookup (missing once the token is revoked or expired)
+    user_id = await get_session(jti)
+    if user_id is None:
         raise credentials_exception
     
     # Get user from database using Beanie
-    user = await User.find_one(User.email == email)
+    user = await User.get(user_id)
     
     if user is None:
         raise credentials_exception
@@ -42,6 +77,19 @@ async def get_current_user(
             detail="Inactive user"
         )
     
+    # Never serve a cached user beyond the token's own expiry
+    _USER_CACHE[key] = (user, jti, payload["exp"])
+    return user, jti
+
+async def get_current_user(request: Request) -> User:
+    """Dependency to get current authenticated user (resolved by AuthMiddleware)"""
+    user = getattr(request.state, "user", None)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     return user
 
 async def get_current_active_user(
@@ -0,0 +1,61 @@
+"""
+Authentication Middleware
+Resolves the bearer token once per request for protected routes
+"""
+from fastapi import HTTPException, status
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.api.deps import authenticate_token
+
+# Route prefixes that require a valid bearer token
+PROTECTED_PATHS = ("/api/v1/projects", "/api/auth/me", "/api/auth/logout")
+
+
+def is_protected_path(path: str) -> bool:
+    """Check whether a request path requires authentication"""
+    return any(path == prefix or path.startswith(prefix + "/") for prefix in PROTECTED_PATHS)
+
+
+def _bearer_token(scope: Scope) -> str:
+    """Extract the bearer token from the Authorization header"""
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer" and token:
+                return token
+            break
+    raise HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Not authenticated",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+class AuthMiddleware:
+    """
+    Pure ASGI middleware that authenticates protected routes and stores the
+    user (plus raw token and session id) on request.state for get_current_user
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] == "OPTIONS" or not is_protected_path(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+        
+        try:
+            token = _bearer_token(scope)
+            user, jti = await authenticate_token(token)
+        except HTTPException as e:
+            response = JSONResponse({"detail": e.detail}, status_code=e.status_code, headers=e.headers)
+            await response(scope, receive, send)
+            return
+        
+        state = scope.setdefault("state", {})
+        state["user"] = user
+        state["token"] = token
+        state["jti"] = jti
+        await self.app(scope, receive, send)
@@ -1,28 +1,39 @@
-from datetime import timedelta
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+import hashlib
+from typing import Dict, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from starlette.concurrency import run_in_threadpool
+from pymongo.errors import DuplicateKeyError
 
 from app.models.user import User, UserCreate, UserLogin, UserResponse, Token
-from app.core.security import verify_password, get_password_hash, create_access_token
-from app.core.config import settings
-from app.api.deps import get_current_user
+from app.core.security import verify_password, get_password_hash, DUMMY_PASSWORD_HASH
+from app.db.sessions import delete_session
+from app.api.deps import get_current_user, invalidate_token, issue_access_token
 
 router = APIRouter()
 
+# In-flight credential checks, so concurrent identical logins share one lookup + bcrypt verify
+_login_inflight: Dict[bytes, asyncio.Task] = {}
+
+async def _check_credentials(email: str, password: str) -> Tuple[Optional[User], bool]:
+    """Look up a user by email and verify the password (skipped for inactive users)"""
+    user = await User.find_one(User.email == email)
+    
+    # Inactive accounts can never log in, so don't spend a bcrypt slot on them
+    if user and not user.is_active:
+        return user, False
+    
+    # Unknown emails still pay the bcrypt cost to avoid leaking which accounts exist
+    hashed_password = user.hashed_password if user else DUMMY_PASSWORD_HASH
+    valid = await run_in_threadpool(verify_password, password, hashed_password)
+    return user, valid
+
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(user_data: UserCreate):
     """Register a new user"""
     
-    # Check if user already exists
-    existing_user = await User.find_one(User.email == user_data.email)
-    
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
-        )
-    
-    # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    # Create new user (bcrypt is CPU-bound, keep it off the event loop)
+    hashed_password = await run_in_threadpool(get_password_hash, user_data.password)
     db_user = User(
         email=user_data.email,
         hashed_password=hashed_password,
@@ -30,8 +41,14 @@ async def register(user_data: UserCreate):
         is_superuser=user_data.is_superuser
     )
     
-    # Save to database
-    await db_user.insert()
+    # Save to database (the unique email index rejects duplicates)
+    try:
+        await db_user.insert()
+    except DuplicateKeyError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
     
     # Convert to response format
     return UserResponse(
@@ -46,29 +63,30 @@ async def register(user_data: UserCreate):
 async def login(credentials: UserLogin):
     """Login and get access token"""
     
-    # Find user by email
-    user = await User.find_one(User.email == credentials.email)
+    # Join an identical login already in progress (keyed on email + password so
+    # different passwords never share a result), otherwise start one
+    key = hashlib.blake2b(f"{credentials.email}\0{credentials.password}".encode(), digest_size=16).digest()
+    task = _login_inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_check_credentials(credentials.email, credentials.password))
+        _login_inflight[key] = task
+        task.add_done_callback(lambda _: _login_inflight.pop(key, None))
+    
+    # Shield so one cancelled request doesn't cancel the check for the others
+    user, valid = await asyncio.shield(task)
     
-    # Verify credentials
-    if not user or not verify_password(credentials.password, user.hashed_password):
+    # Inactive accounts fail here too with the same generic error. They skip the bcrypt
+    # verify, so they answer measurably faster than a wrong password on an active account:
+    # that timing difference (account exists but is disabled) is accepted to save the work
+    if not user or not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    if not user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Inactive user"
-        )
-    
-    # Create access token
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": user.email},
-        expires_delta=access_token_expires
-    )
+    # Create access token and its session
+    access_token = await issue_access_token(user)
     
     return {"access_token": access_token, "token_type": "bearer"}
 
@@ -78,7 +96,7 @@ async def get_current_user_info(
 ):
     """Get current user information"""
     return UserResponse(
-        id=str(current_user.id),
+        id=current_user.id_str,
         email=current_user.email,
         is_active=current_user.is_active,
         is_superuser=current_user.is_superuser,
@@ -86,6 +104,8 @@ async def get_current_user_info(
     )
 
 @router.post("/logout")
-async def logout(current_user: User = Depends(get_current_user)):
-    """Logout (client should delete token)"""
+async def logout(request: Request, current_user: User = Depends(get_current_user)):
+    """Logout (revokes the token's session)"""
+    await delete_session(request.state.jti)
+    invalidate_token(request.state.token)
     return {"message": "Successfully logged out"}
@@ -2,10 +2,15 @@
 Projects API Routes
 Handles project generation and management
 """
-from typing import List
+from typing import AsyncIterator, List
+import orjson
+from beanie import PydanticObjectId
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 
-from app.models.project import Project, ProjectCreate, ProjectUpdate, ProjectResponse, ModelType
+from app.models.project import (
+    Project, ProjectCreate, ProjectUpdate, ProjectResponse, ProjectSummary, ProjectSummaryResponse, ModelType
+)
 from app.models.user import User
 from app.models.location import LocationResponse
 from app.models.road import RoadResponse
@@ -15,6 +20,84 @@ from app.services.project_generator import generate_project_layout
 router = APIRouter()
 
 
+def _serialize_project(project: Project) -> ProjectResponse:
+    """
+    Build the response model for a stored project.
+    Data comes straight from the database, so validation is skipped via model_construct.
+    """
+    return ProjectResponse.model_construct(
+        id=str(project.id),
+        name=project.name,
+        description=project.description,
+        model_type=project.model_type,
+        sectors=project.sectors,
+        theme=project.theme,
+        user_id=project.user_id,
+        locations=[
+            LocationResponse.model_construct(
+                id=loc.id,
+                name=loc.name,
+                type=loc.type,
+                position=loc.position,
+                description=loc.description,
+                color=loc.color,
+                zone=loc.zone
+            )
+            for loc in project.locations
+        ],
+        roads=[
+            RoadResponse.model_construct(
+                id=road.id,
+                from_location=road.from_location,
+                to_location=road.to_location,
+                distance=road.distance,
+                type=road.type
+            )
+            for road in project.roads
+        ],
+        created_at=project.created_at,
+        updated_at=project.updated_at
+    )
+
+
+def _owned_project(project_id: str, user_id: str):
+    """
+    Query for a project that exists AND belongs to the user, in one round trip.
+    Missing, foreign and malformed ids all surface as 404 so ids can't be probed.
+    """
+    if not PydanticObjectId.is_valid(project_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+    return Project.find_one(Project.id == PydanticObjectId(project_id), Project.user_id == user_id)
+
+
+def _serialize_summary(summary: ProjectSummary) -> ProjectSummaryResponse:
+    """Build the listing response for a projected project (no locations/roads)"""
+    return ProjectSummaryResponse.model_construct(
+        id=str(summary.id),
+        name=summary.name,
+        description=summary.description,
+        model_type=summary.model_type,
+        sectors=summary.sectors,
+        theme=summary.theme,
+        user_id=summary.user_id,
+        created_at=summary.created_at,
+        updated_at=summary.updated_at
+    )
+
+
+async def _stream_summaries(projects) -> AsyncIterator[bytes]:
+    """Stream projected projects as a JSON array, encoding each element as the cursor yields it"""
+    yield b"["
+    separator = b""
+    async for summary in projects:
+        yield separator + orjson.dumps(_serialize_summary(summary).model_dump())
+        separator = b","
+    yield b"]"
+
+
 @router.post("/generate", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
 async def generate_project(
     project_data: ProjectCreate,
@@ -61,7 +144,7 @@ async def generate_project(
         model_type=project_data.model_type,
         sectors=project_data.sectors,
         theme=project_data.theme,
-        user_id=str(current_user.id),
+        user_id=current_user.id_str,
         locations=locations,
         roads=roads
     )
@@ -70,90 +153,25 @@ async def generate_project(
     await project.insert()
     
     # Convert to response format
-    return ProjectResponse(
-        id=str(project.id),
-        name=project.name,
-        description=project.description,
-        model_type=project.model_type,
-        sectors=project.sectors,
-        theme=project.theme,
-        user_id=project.user_id,
-        locations=[
-            LocationResponse(
-                id=loc.id,
-                name=loc.name,
-                type=loc.type,
-                position=loc.position.to_list(),
-                description=loc.description,
-                color=loc.color,
-                zone=loc.zone
-            )
-            for loc in project.locations
-        ],
-        roads=[
-            RoadResponse(
-                id=road.id,
-                from_location=road.from_location,
-                to_location=road.to_location,
-                distance=road.distance,
-                type=road.type
-            )
-            for road in project.roads
-        ],
-        created_at=project.created_at,
-        updated_at=project.updated_at
-    )
+    return _serialize_project(project)
 
 
-@router.get("/", response_model=List[ProjectResponse])
+@router.get("/", response_model=List[ProjectSummaryResponse])
 async def list_projects(
     current_user: User = Depends(get_current_user),
     skip: int = 0,
     limit: int = 100
 ):
     """
-    List all projects for the current user
+    List all projects for the current user, newest first
+    Returns metadata only; fetch a single project for its locations and roads.
+    The array is streamed straight from the cursor rather than built in memory.
     """
-    projects = await Project.find(
-        Project.user_id == str(current_user.id)
-    ).skip(skip).limit(limit).to_list()
+    projects = Project.find(
+        Project.user_id == current_user.id_str
+    ).sort(-Project.created_at).skip(skip).limit(limit).project(ProjectSummary)
     
-    return [
-        ProjectResponse(
-            id=str(project.id),
-            name=project.name,
-            description=project.description,
-            model_type=project.model_type,
-            sectors=project.sectors,
-            theme=project.theme,
-            user_id=project.user_id,
-            locations=[
-                LocationResponse(
-                    id=loc.id,
-                    name=loc.name,
-                    type=loc.type,
-                    position=loc.position.to_list(),
-                    description=loc.description,
-                    color=loc.color,
-                    zone=loc.zone
-                )
-                for loc in project.locations
-            ],
-            roads=[
-                RoadResponse(
-                    id=road.id,
-                    from_location=road.from_location,
-                    to_location=road.to_location,
-                    distance=road.distance,
-                    type=road.type
-                )
-                for road in project.roads
-            ],
-            created_at=project.created_at,
-            updated_at=project.updated_at
-        )
-        for project in projects
-    ]
+    return StreamingResponse(_stream_summaries(projects), media_type="application/json")
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
@@ -164,7 +182,7 @@ async def get_project(
     """
     Get a specific project by ID
     """
-    project = await Project.get(project_id)
+    project = await _owned_project(project_id, current_user.id_str)
     
     if not project:
         raise HTTPException(
@@ -172,46 +190,7 @@ async def get_project(
             detail="Project not found"
         )
     
-    # Verify ownership
-    if project.user_id != str(current_user.id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this project"
-        )
-    
-    return ProjectResponse(
-        id=str(project.id),
-        name=project.name,
-        description=project.description,
-        model_type=project.model_type,
-        sectors=project.sectors,
-        theme=project.theme,
-        user_id=project.user_id,
-        locations=[
-            LocationResponse(
-                id=loc.id,
-                name=loc.name,
-                type=loc.type,
-                position=loc.position.to_list(),
-                description=loc.description,
-                color=loc.color,
-                zone=loc.zone
-            )
-            for loc in project.locations
-        ],
-        roads=[
-            RoadResponse(
-                id=road.id,
-                from_location=road.from_location,
-                to_location=road.to_location,
-                distance=road.distance,
-                type=road.type
-            )
-            for road in project.roads
-        ],
-        created_at=project.created_at,
-        updated_at=project.updated_at
-    )
+    return _serialize_project(project)
 
 
 @router.put("/{project_id}", response_model=ProjectResponse)
@@ -224,7 +203,8 @@ async def update_project(
     Update a project's metadata (name, description, sectors, theme)
     Note: Does not regenerate locations/roads
     """
-    project = await Project.get(project_id)
+    # Owner-scoped like get/delete: another user's project is indistinguishable from a missing one
+    project = await _owned_project(project_id, current_user.id_str)
     
     if not project:
         raise HTTPException(
@@ -232,13 +212,6 @@ async def update_project(
             detail="Project not found"
         )
     
-    # Verify ownership
-    if project.user_id != str(current_user.id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to update this project"
-        )
-    
     # Update fields that were provided
     update_data = project_update.model_dump(exclude_unset=True)
     if update_data:
@@ -252,39 +225,7 @@ async def update_project(
         await project.save()
     
     # Return updated project
-    return ProjectResponse(
-        id=str(project.id),
-        name=project.name,
-        description=project.description,
-        model_type=project.model_type,
-        sectors=project.sectors,
-        theme=project.theme,
-        user_id=project.user_id,
-        locations=[
-            LocationResponse(
-                id=loc.id,
-                name=loc.name,
-                type=loc.type,
-                position=loc.position.to_list(),
-                description=loc.description,
-                color=loc.color,
-                zone=loc.zone
-            )
-            for loc in project.locations
-        ],
-        roads=[
-            RoadResponse(
-                id=road.id,
-                from_location=road.from_location,
-                to_location=road.to_location,
-                distance=road.distance,
-                type=road.type
-            )
-            for road in project.roads
-        ],
-        created_at=project.created_at,
-        updated_at=project.updated_at
-    )
+    return _serialize_project(project)
 
 
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -295,20 +236,13 @@ async def delete_project(
     """
     Delete a project
     """
-    project = await Project.get(project_id)
+    # Single deleteOne scoped to the owner
+    result = await _owned_project(project_id, current_user.id_str).delete()
     
-    if not project:
+    if not result or result.deleted_count == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found"
         )
     
-    # Verify ownership
-    if project.user_id != str(current_user.id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to delete this project"
-        )
-    
-    await project.delete()
     return None
@@ -8,12 +8,22 @@ class Settings(BaseSettings):
     # Database
     MONGODB_URL: str
     DATABASE_NAME: str = "city_planning"
+    MONGODB_MIN_POOL_SIZE: int = 10
+    MONGODB_MAX_POOL_SIZE: int = 100
+    MONGODB_MAX_IDLE_TIME_MS: int = 1_800_000
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS: int = 5_000
+    
+    # Session store (required unless DEBUG; in-process when unset)
+    REDIS_URL: Optional[str] = None
     
     # JWT
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
+    # Password hashing
+    BCRYPT_ROUNDS: int = 12
+    
     # App
     APP_NAME: str = "City Planning Platform"
     APP_VERSION: str = "1.0.0"
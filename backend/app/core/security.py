@@ -1,19 +1,38 @@
+import base64
+import calendar
+import hashlib
+import hmac
+import uuid
 from datetime import datetime, timedelta
 from typing import Optional
+import bcrypt
+import orjson
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from app.core.config import settings
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against a hashed password"""
-    return pwd_context.verify(plain_password, hashed_password)
+    return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
 
 def get_password_hash(password: str) -> str:
     """Hash a password using bcrypt"""
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)).decode()
+
+# Hash checked against when no user matches, so failed logins cost the same bcrypt work
+DUMMY_PASSWORD_HASH = get_password_hash("dummy-password")
+
+def _b64url(data: bytes) -> bytes:
+    """Unpadded base64url encoding used by JWT segments"""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+# HMAC signing state prepared once: the header segment never changes and the keyed
+# HMAC is copied per token instead of re-deriving the key pads on every call
+_HMAC_DIGESTS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+_HEADER_SEGMENT = _b64url(orjson.dumps({"alg": settings.ALGORITHM, "typ": "JWT"}))
+_HMAC_SIGNER = (
+    hmac.new(settings.SECRET_KEY.encode(), digestmod=_HMAC_DIGESTS[settings.ALGORITHM])
+    if settings.ALGORITHM in _HMAC_DIGESTS else None
+)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token"""
@@ -24,8 +43,22 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-    return encoded_jwt
+    to_encode.setdefault("jti", uuid.uuid4().hex)
+    
+    # Registered time claims become NumericDates, as jwt.encode does
+    for time_claim in ("exp", "iat", "nbf"):
+        value = to_encode.get(time_claim)
+        if isinstance(value, datetime):
+            to_encode[time_claim] = calendar.timegm(value.utctimetuple())
+    
+    # Non-HMAC algorithms go through python-jose
+    if _HMAC_SIGNER is None:
+        return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    
+    signing_input = _HEADER_SEGMENT + b"." + _b64url(orjson.dumps(to_encode))
+    signer = _HMAC_SIGNER.copy()
+    signer.update(signing_input)
+    return (signing_input + b"." + _b64url(signer.digest())).decode()
 
 def decode_access_token(token: str) -> Optional[dict]:
     """Decode and verify a JWT token"""
@@ -1,14 +1,22 @@
-from motor.motor_asyncio import AsyncIOMotorClient
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from beanie import init_beanie
 from app.core.config import settings
 
-# MongoDB client
+# MongoDB client and database handle (created once at startup)
 mongo_client: AsyncIOMotorClient = None
+database: AsyncIOMotorDatabase = None
 
 async def connect_to_mongo():
     """Connect to MongoDB"""
-    global mongo_client
-    mongo_client = AsyncIOMotorClient(settings.MONGODB_URL)
+    global mongo_client, database
+    mongo_client = AsyncIOMotorClient(
+        settings.MONGODB_URL,
+        minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
+        maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+        maxIdleTimeMS=settings.MONGODB_MAX_IDLE_TIME_MS,
+        serverSelectionTimeoutMS=settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS
+    )
+    database = mongo_client[settings.DATABASE_NAME]
     print(f"✅ Connected to MongoDB at {settings.MONGODB_URL}")
 
 async def close_mongo_connection():
@@ -26,11 +34,11 @@ async def init_db():
     
     # Initialize Beanie with the document models only
     await init_beanie(
-        database=mongo_client[settings.DATABASE_NAME],
+        database=database,
         document_models=[User, Project]
     )
     print(f"✅ Beanie initialized with database: {settings.DATABASE_NAME}")
 
 def get_database():
     """Get database instance"""
-    return mongo_client[settings.DATABASE_NAME]
\ No newline at end of file
+    return database
\ No newline at end of file
@@ -0,0 +1,75 @@
+"""
+Session store for issued access tokens
+Sessions are keyed by the token's jti claim and expire with the token.
+Backed by Redis when REDIS_URL is configured, otherwise kept in-process. The fallback
+is only allowed with DEBUG or TESTING (lost on restart and not shared between workers).
+"""
+import os
+import time
+from typing import Optional
+from cachetools import TLRUCache
+from redis.asyncio import Redis
+from app.core.config import settings
+
+# Redis client (None when REDIS_URL is not configured)
+redis_client: Optional[Redis] = None
+
+# In-process fallback: jti -> (user id, expiry timestamp). Each entry expires with its
+# token and the store is size-capped, so unused sessions never accumulate
+_LOCAL_SESSIONS_MAXSIZE = 100_000
+_local_sessions: TLRUCache = TLRUCache(
+    maxsize=_LOCAL_SESSIONS_MAXSIZE,
+    ttu=lambda _jti, session, _now: session[1],
+    timer=time.time
+)
+
+def _session_key(jti: str) -> str:
+    return f"sess:{jti}"
+
+async def connect_to_redis():
+    """Connect to Redis; only DEBUG or test runs may fall back to the in-process store"""
+    global redis_client
+    if settings.REDIS_URL:
+        redis_client = Redis.from_url(settings.REDIS_URL, decode_responses=True)
+        print(f"✅ Connected to Redis at {settings.REDIS_URL}")
+    elif not (settings.DEBUG or os.getenv("TESTING")):
+        raise RuntimeError(
+            "REDIS_URL must be set outside DEBUG: the in-process session store is lost on "
+            "restart and not shared between workers"
+        )
+    else:
+        print(
+            "⚠️  REDIS_URL not set: sessions are kept in-process. Restarts (including reloads) "
+            "log everyone out, and tokens only work on the worker that issued them."
+        )
+
+async def close_redis_connection():
+    """Close Redis connection"""
+    global redis_client
+    if redis_client:
+        await redis_client.aclose()
+        redis_client = None
+        print("🔴 Redis connection closed")
+
+async def create_session(jti: str, user_id: str, ttl_seconds: int):
+    """Register an issued token as an active session"""
+    if redis_client:
+        await redis_client.setex(_session_key(jti), ttl_seconds, user_id)
+    else:
+        _local_sessions[jti] = (user_id, time.time() + ttl_seconds)
+
+async def get_session(jti: str) -> Optional[str]:
+    """Return the user id of an active session, or None if revoked/expired"""
+    if redis_client:
+        return await redis_client.get(_session_key(jti))
+    
+    # Expired entries are dropped by the cache itself
+    session = _local_sessions.get(jti)
+    return session[0] if session is not None else None
+
+async def delete_session(jti: str):
+    """Revoke a session"""
+    if redis_client:
+        await redis_client.delete(_session_key(jti))
+    else:
+        _local_sessions.pop(jti, None)
@@ -1,10 +1,14 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.openapi.utils import get_openapi
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 
 from app.core.config import settings
 from app.db.database import connect_to_mongo, close_mongo_connection, init_db
+from app.db.sessions import connect_to_redis, close_redis_connection
 from app.api.routes import auth, projects
+from app.api.middleware import AuthMiddleware, is_protected_path
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -13,18 +17,24 @@ async def lifespan(app: FastAPI):
     print("🚀 Starting up City Planning API...")
     await connect_to_mongo()
     await init_db()
+    await connect_to_redis()
     print("✅ Database initialized and ready")
     yield
     # Shutdown
     print("🔴 Shutting down...")
+    await close_redis_connection()
     await close_mongo_connection()
 
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
+# Authentication for protected routes (added first so CORS wraps its error responses)
+app.add_middleware(AuthMiddleware)
+
 # CORS Configuration
 app.add_middleware(
     CORSMiddleware,
@@ -38,6 +48,25 @@ app.add_middleware(
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(projects.router, prefix="/api/v1/projects", tags=["Projects"])
 
+def custom_openapi():
+    """OpenAPI schema with bearer auth declared on routes guarded by AuthMiddleware"""
+    if app.openapi_schema:
+        return app.openapi_schema
+    
+    schema = get_openapi(title=app.title, version=app.version, routes=app.routes)
+    schema.setdefault("components", {})["securitySchemes"] = {
+        "HTTPBearer": {"type": "http", "scheme": "bearer"}
+    }
+    for path, operations in schema["paths"].items():
+        if is_protected_path(path):
+            for operation in operations.values():
+                operation["security"] = [{"HTTPBearer": []}]
+    
+    app.openapi_schema = schema
+    return schema
+
+app.openapi = custom_openapi
+
 @app.get("/")
 async def root():
     return {
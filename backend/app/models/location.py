@@ -1,8 +1,8 @@
-from typing import Optional, List
-from pydantic import BaseModel, Field
+from typing import Optional, List, NamedTuple
+from pydantic import BaseModel, Field, field_validator
 
-class LocationPosition(BaseModel):
-    """3D Position coordinates"""
+class LocationPosition(NamedTuple):
+    """3D Position coordinates (helper view over a stored [x, y, z] list)"""
     x: float
     y: float
     z: float
@@ -10,22 +10,30 @@ class LocationPosition(BaseModel):
     @classmethod
     def from_list(cls, position: List[float]):
         """Create from list [x, y, z]"""
-        return cls(x=position[0], y=position[1], z=position[2])
+        return cls(*position)
     
     def to_list(self) -> List[float]:
         """Convert to list format"""
-        return [self.x, self.y, self.z]
+        return list(self)
 
 class LocationEmbedded(BaseModel):
     """Embedded Location model (no separate document)"""
     id: str  # Generated unique ID within project
     name: str
     type: str  # e.g., 'Building', 'Hospital', 'Park'
-    position: LocationPosition
+    position: List[float] = Field(min_length=3, max_length=3)  # [x, y, z]
     description: Optional[str] = None
     color: Optional[str] = "#60a5fa"
     zone: Optional[str] = None
     
+    @field_validator("position", mode="before")
+    @classmethod
+    def _position_from_legacy_dict(cls, value):
+        """Accept documents stored before positions were flattened to [x, y, z]"""
+        if isinstance(value, dict):
+            return [value["x"], value["y"], value["z"]]
+        return value
+    
     class Config:
         from_attributes = True
 
@@ -1,7 +1,8 @@
 from typing import Optional, List
 from datetime import datetime
-from beanie import Document
+from beanie import Document, PydanticObjectId
 from pydantic import BaseModel, Field
+import pymongo
 from enum import Enum
 
 from app.models.location import LocationEmbedded, LocationResponse
@@ -31,9 +32,22 @@ class Project(Document):
     class Settings:
         name = "projects"
         indexes = [
-            "user_id",
+            # Serves the per-user listing (filter + newest-first sort) as an index range scan
+            [("user_id", pymongo.ASCENDING), ("created_at", pymongo.DESCENDING)],
         ]
 
+class ProjectSummary(BaseModel):
+    """Projection of a project without its embedded locations and roads (used for listing)"""
+    id: PydanticObjectId = Field(alias="_id")
+    name: str
+    description: str = ""
+    model_type: ModelType = ModelType.PLANNING
+    sectors: Optional[List[str]] = None
+    theme: Optional[str] = None
+    user_id: str
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
 class ProjectCreate(BaseModel):
     """Schema for creating a project with generation"""
     name: str = Field(min_length=1, max_length=200)
@@ -65,3 +79,18 @@ class ProjectResponse(BaseModel):
     
     class Config:
         from_attributes = True
+
+class ProjectSummaryResponse(BaseModel):
+    """Schema for project listing response (metadata only)"""
+    id: str
+    name: str
+    description: str
+    model_type: ModelType
+    sectors: Optional[List[str]] = None
+    theme: Optional[str] = None
+    user_id: str
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
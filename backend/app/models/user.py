@@ -1,7 +1,7 @@
 from typing import Optional
 from datetime import datetime
 from beanie import Document, Indexed
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, PrivateAttr
 
 class User(Document):
     """User database model"""
@@ -12,11 +12,20 @@ class User(Document):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: Optional[datetime] = None
     
+    # Private attribute, so the cached string is never serialized into the document
+    _id_str: Optional[str] = PrivateAttr(default=None)
+    
+    @property
+    def id_str(self) -> str:
+        """String form of the document id (cached once the user has an id)"""
+        if self.id is None:
+            return str(self.id)
+        if self._id_str is None:
+            self._id_str = str(self.id)
+        return self._id_str
+    
     class Settings:
         name = "users"
-        indexes = [
-            "email",
-        ]
 
 class UserCreate(BaseModel):
     """Schema for creating a new user"""
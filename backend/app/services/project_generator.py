@@ -21,110 +21,107 @@ Architecture:
     
 Performance:
     - O(n) time complexity for location generation
-    - O(n²) worst-case for road generation (hub connectivity)
+    - O(n) for road generation (one road per zone plus consecutive intra-zone pairs)
+    - Numeric kernels (radial trig, road distances) are single NumPy calls; radial
+      rings are cached per zone count
     - Optimized for up to 50 locations per project
 """
 import math
+import sys
 import uuid
-from typing import List, Tuple, Dict
-from app.models.location import LocationEmbedded, LocationPosition
+from functools import lru_cache
+import numpy as np
+from typing import List, NamedTuple, Tuple, Dict, Sequence
+from app.models.location import LocationEmbedded
 from app.models.road import RoadEmbedded
 from app.models.project import ModelType
 
 
-# Zone Templates for City Planning
+class BuildingTpl(NamedTuple):
+    """Immutable building template (fields read by attribute in the generator)"""
+    name: str
+    type: str
+    color: str
+    description: str
+
+
+# Zone Templates for City Planning (sector -> tuple of building templates)
 CITY_ZONE_TEMPLATES = {
-    "government": {
-        "buildings": [
-            {"name": "City Hall", "type": "Building", "color": "#3b82f6", "description": "The central administrative building of the city."},
-            {"name": "Police Headquarters", "type": "Building", "color": "#1d4ed8", "description": "Main police station serving the city."}
-        ]
-    },
-    "healthcare": {
-        "buildings": [
-            {"name": "Central Hospital", "type": "Hospital", "color": "#ef4444", "description": "Major medical facility with emergency and specialist care."},
-            {"name": "Medical Center", "type": "Hospital", "color": "#ef4444", "description": "Modern healthcare facility with outpatient services."}
-        ]
-    },
-    "education": {
-        "buildings": [
-            {"name": "Public Library", "type": "Library", "color": "#84cc16", "description": "Main library with extensive collection and study areas."},
-            {"name": "High School", "type": "School", "color": "#fb923c", "description": "Public high school with modern facilities."}
-        ]
-    },
-    "commercial": {
-        "buildings": [
-            {"name": "Shopping Mall", "type": "Shop", "color": "#a78bfa", "description": "Large retail complex with diverse stores."},
-            {"name": "Office Tower", "type": "Building", "color": "#60a5fa", "description": "Modern office building housing various businesses."}
-        ]
-    },
-    "residential": {
-        "buildings": [
-            {"name": "Apartment Complex", "type": "Building", "color": "#8b5cf6", "description": "Modern residential complex with amenities."},
-            {"name": "Hotel District", "type": "Hotel", "color": "#06b6d4", "description": "Upscale hotels and accommodations."}
-        ]
-    },
-    "green": {
-        "buildings": [
-            {"name": "Central Park", "type": "Park", "color": "#4ade80", "description": "Large urban park with recreational facilities."},
-            {"name": "Botanical Gardens", "type": "Park", "color": "#4ade80", "description": "Beautiful gardens with diverse plant species."}
-        ]
-    },
-    "transportation": {
-        "buildings": [
-            {"name": "Central Station", "type": "Building", "color": "#64748b", "description": "Main transportation hub connecting the city."},
-            {"name": "Bus Terminal", "type": "Building", "color": "#64748b", "description": "Central bus station serving the city."}
-        ]
-    }
+    "government": (
+        BuildingTpl("City Hall", "Building", "#3b82f6", "The central administrative building of the city."),
+        BuildingTpl("Police Headquarters", "Building", "#1d4ed8", "Main police station serving the city.")
+    ),
+    "healthcare": (
+        BuildingTpl("Central Hospital", "Hospital", "#ef4444", "Major medical facility with emergency and specialist care."),
+        BuildingTpl("Medical Center", "Hospital", "#ef4444", "Modern healthcare facility with outpatient services.")
+    ),
+    "education": (
+        BuildingTpl("Public Library", "Library", "#84cc16", "Main library with extensive collection and study areas."),
+        BuildingTpl("High School", "School", "#fb923c", "Public high school with modern facilities.")
+    ),
+    "commercial": (
+        BuildingTpl("Shopping Mall", "Shop", "#a78bfa", "Large retail complex with diverse stores."),
+        BuildingTpl("Office Tower", "Building", "#60a5fa", "Modern office building housing various businesses.")
+    ),
+    "residential": (
+        BuildingTpl("Apartment Complex", "Building", "#8b5cf6", "Modern residential complex with amenities."),
+        BuildingTpl("Hotel District", "Hotel", "#06b6d4", "Upscale hotels and accommodations.")
+    ),
+    "green": (
+        BuildingTpl("Central Park", "Park", "#4ade80", "Large urban park with recreational facilities."),
+        BuildingTpl("Botanical Gardens", "Park", "#4ade80", "Beautiful gardens with diverse plant species.")
+    ),
+    "transportation": (
+        BuildingTpl("Central Station", "Building", "#64748b", "Main transportation hub connecting the city."),
+        BuildingTpl("Bus Terminal", "Building", "#64748b", "Central bus station serving the city.")
+    )
 }
 
-# Zone Templates for Corporate Campus
+# Zone Templates for Corporate Campus (sector -> tuple of building templates)
 CORPORATE_ZONE_TEMPLATES = {
-    "admin": {
-        "buildings": [
-            {"name": "Main Office Building", "type": "Building", "color": "#3b82f6", "description": "Corporate headquarters with executive offices."},
-            {"name": "HR & Finance Block", "type": "Building", "color": "#1d4ed8", "description": "Administrative offices for HR and Finance departments."}
-        ]
-    },
-    "research": {
-        "buildings": [
-            {"name": "Research Lab A", "type": "Building", "color": "#ef4444", "description": "Advanced research and development facility."},
-            {"name": "Innovation Center", "type": "Building", "color": "#ef4444", "description": "Collaborative space for innovation and prototyping."}
-        ]
-    },
-    "conference": {
-        "buildings": [
-            {"name": "Main Conference Hall", "type": "Building", "color": "#84cc16", "description": "Large conference facility for corporate events."},
-            {"name": "Training Center", "type": "Building", "color": "#fb923c", "description": "Employee training and development center."}
-        ]
-    },
-    "cafeteria": {
-        "buildings": [
-            {"name": "Main Cafeteria", "type": "Restaurant", "color": "#a78bfa", "description": "Central dining facility for employees."},
-            {"name": "Coffee Shop", "type": "Cafe", "color": "#60a5fa", "description": "Casual coffee shop and break area."}
-        ]
-    },
-    "clinic": {
-        "buildings": [
-            {"name": "Medical Center", "type": "Hospital", "color": "#8b5cf6", "description": "On-site medical facility for employees."}
-        ]
-    },
-    "parking": {
-        "buildings": [
-            {"name": "Main Parking Structure", "type": "Building", "color": "#4ade80", "description": "Multi-level employee parking facility."},
-            {"name": "Visitor Parking", "type": "Building", "color": "#4ade80", "description": "Dedicated visitor parking area."}
-        ]
-    },
-    "security": {
-        "buildings": [
-            {"name": "Security Command Center", "type": "Building", "color": "#64748b", "description": "Main security operations center."},
-            {"name": "Entry Gate Complex", "type": "Building", "color": "#64748b", "description": "Main entrance security checkpoint."}
-        ]
-    }
+    "admin": (
+        BuildingTpl("Main Office Building", "Building", "#3b82f6", "Corporate headquarters with executive offices."),
+        BuildingTpl("HR & Finance Block", "Building", "#1d4ed8", "Administrative offices for HR and Finance departments.")
+    ),
+    "research": (
+        BuildingTpl("Research Lab A", "Building", "#ef4444", "Advanced research and development facility."),
+        BuildingTpl("Innovation Center", "Building", "#ef4444", "Collaborative space for innovation and prototyping.")
+    ),
+    "conference": (
+        BuildingTpl("Main Conference Hall", "Building", "#84cc16", "Large conference facility for corporate events."),
+        BuildingTpl("Training Center", "Building", "#fb923c", "Employee training and development center.")
+    ),
+    "cafeteria": (
+        BuildingTpl("Main Cafeteria", "Restaurant", "#a78bfa", "Central dining facility for employees."),
+        BuildingTpl("Coffee Shop", "Cafe", "#60a5fa", "Casual coffee shop and break area.")
+    ),
+    "clinic": (
+        BuildingTpl("Medical Center", "Hospital", "#8b5cf6", "On-site medical facility for employees."),
+    ),
+    "parking": (
+        BuildingTpl("Main Parking Structure", "Building", "#4ade80", "Multi-level employee parking facility."),
+        BuildingTpl("Visitor Parking", "Building", "#4ade80", "Dedicated visitor parking area.")
+    ),
+    "security": (
+        BuildingTpl("Security Command Center", "Building", "#64748b", "Main security operations center."),
+        BuildingTpl("Entry Gate Complex", "Building", "#64748b", "Main entrance security checkpoint.")
+    )
 }
 
+# Sector names accepted per model type
+_CITY_KEYS = frozenset(CITY_ZONE_TEMPLATES)
+_CORPORATE_KEYS = frozenset(CORPORATE_ZONE_TEMPLATES)
+
+# Road id prefix per road type
+_ROAD_ID_PREFIX = {"main": "r_main", "secondary": "r_sec"}
+
+# Building offsets step by π/4, so the angles repeat every 8 buildings
+_OFFSET_SLOTS = 8
+_OFFSET_COS = tuple(math.cos(i * math.pi / 4) for i in range(_OFFSET_SLOTS))
+_OFFSET_SIN = tuple(math.sin(i * math.pi / 4) for i in range(_OFFSET_SLOTS))
+
 
-def calculate_distance(pos1: LocationPosition, pos2: LocationPosition) -> float:
+def calculate_distance(pos1: Sequence[float], pos2: Sequence[float]) -> float:
     """
     Calculate 3D Euclidean distance between two location positions.
     
@@ -132,21 +129,19 @@ def calculate_distance(pos1: LocationPosition, pos2: LocationPosition) -> float:
     distance = √(Δx² + Δy² + Δz²)
     
     Args:
-        pos1: First location position with x, y, z coordinates
-        pos2: Second location position with x, y, z coordinates
+        pos1: First location position as (x, y, z) (any 3-item sequence)
+        pos2: Second location position as (x, y, z) (any 3-item sequence)
         
     Returns:
         float: Distance in world units between the two positions
         
     Example:
-        >>> pos1 = LocationPosition(x=0, y=0, z=0)
-        >>> pos2 = LocationPosition(x=3, y=4, z=0)
-        >>> calculate_distance(pos1, pos2)
+        >>> calculate_distance((0.0, 0.0, 0.0), (3.0, 4.0, 0.0))
         5.0
     """
-    dx = pos2.x - pos1.x
-    dy = pos2.y - pos1.y
-    dz = pos2.z - pos1.z
+    dx = pos2[0] - pos1[0]
+    dy = pos2[1] - pos1[1]
+    dz = pos2[2] - pos1[2]
     return math.sqrt(dx*dx + dy*dy + dz*dz)
 
 
@@ -183,16 +178,19 @@ def generate_radial_positions(num_zones: int, base_radius: float = 20.0) -> List
     if num_zones == 1:
         return [(0.0, 0.0)]  # Single zone at center
     
-    positions = []
-    angle_step = 2 * math.pi / num_zones
-    
-    for i in range(num_zones):
-        angle = i * angle_step
-        x = base_radius * math.cos(angle)
-        z = base_radius * math.sin(angle)
-        positions.append((x, z))
+    # Fresh list per call so callers can't mutate the cached ring
+    return list(_radial_ring(num_zones, base_radius))
+
+
+@lru_cache(maxsize=64)
+def _radial_ring(num_zones: int, base_radius: float) -> Tuple[Tuple[float, float], ...]:
+    """Zone centers for n >= 2 zones, cached since only a handful of (n, radius) pairs occur"""
+    # All angles at once, trig runs in a single vectorized pass
+    angles = np.arange(num_zones) * (2 * np.pi / num_zones)
+    xs = base_radius * np.cos(angles)
+    zs = base_radius * np.sin(angles)
     
-    return positions
+    return tuple(zip(xs.tolist(), zs.tolist()))
 
 
 def generate_project_layout(
@@ -248,10 +246,14 @@ def generate_project_layout(
     """
     
     # Select appropriate templates
-    templates = CITY_ZONE_TEMPLATES if model_type == ModelType.PLANNING else CORPORATE_ZONE_TEMPLATES
+    if model_type == ModelType.PLANNING:
+        templates, template_keys = CITY_ZONE_TEMPLATES, _CITY_KEYS
+    else:
+        templates, template_keys = CORPORATE_ZONE_TEMPLATES, _CORPORATE_KEYS
     
-    # Validate sectors
-    valid_sectors = [s for s in sectors if s in templates]
+    # Validate sectors (order-preserving dedupe, a repeated sector would stack zones and collide ids)
+    # Sectors are interned so the zone dicts below compare keys by identity
+    valid_sectors = list(dict.fromkeys(sys.intern(s) for s in sectors if s in template_keys))
     if not valid_sectors:
         raise ValueError(f"No valid sectors provided for {model_type.value} model")
     
@@ -259,88 +261,90 @@ def generate_project_layout(
     zone_positions = generate_radial_positions(len(valid_sectors), base_radius=20.0)
     
     locations: List[LocationEmbedded] = []
-    location_map: Dict[str, LocationEmbedded] = {}  # For road generation
+    positions: List[Tuple[float, float, float]] = []  # Parallel to locations, plain tuples for the road pass
+    
+    # Zone grouping is filled in as locations are built, no extra passes later
+    zone_representatives: Dict[str, int] = {}  # zone -> index of its first building
+    zones_dict: Dict[str, List[int]] = {}  # zone -> indices of its buildings, in order
     
     # Generate locations for each sector
     for zone_idx, sector in enumerate(valid_sectors):
-        zone_template = templates[sector]
+        buildings = templates[sector]
         zone_center_x, zone_center_z = zone_positions[zone_idx]
         
-        buildings = zone_template["buildings"]
-        
         # Position buildings within the zone (small offset from zone center)
         for building_idx, building_template in enumerate(buildings):
-            # Create slight offset for multiple buildings in same zone
-            offset_angle = (building_idx * math.pi / 4) if len(buildings) > 1 else 0
+            # Create slight offset for multiple buildings in same zone (angle = idx * π/4)
             offset_distance = 3.0 if len(buildings) > 1 else 0
+            offset_slot = building_idx % _OFFSET_SLOTS
             
-            x = zone_center_x + offset_distance * math.cos(offset_angle)
-            z = zone_center_z + offset_distance * math.sin(offset_angle)
+            x = zone_center_x + offset_distance * _OFFSET_COS[offset_slot]
+            z = zone_center_z + offset_distance * _OFFSET_SIN[offset_slot]
             
             # Generate unique ID
             location_id = f"{sector}_{building_idx + 1}"
             
-            location = LocationEmbedded(
+            # Inputs come from hard-coded templates and computed floats, so skip validation
+            location = LocationEmbedded.model_construct(
                 id=location_id,
-                name=building_template["name"],
-                type=building_template["type"],
-                position=LocationPosition(x=x, y=0.0, z=z),
-                description=building_template["description"],
-                color=building_template["color"],
+                name=building_template.name,
+                type=building_template.type,
+                position=[x, 0.0, z],
+                description=building_template.description,
+                color=building_template.color,
                 zone=sector
             )
             
+            location_idx = len(locations)
             locations.append(location)
-            location_map[location_id] = location
+            positions.append((x, 0.0, z))
+            if building_idx == 0:
+                # Sectors are deduplicated, so a zone's first building is its representative
+                zone_representatives[sector] = location_idx
+            zones_dict.setdefault(sector, []).append(location_idx)
     
     # Generate roads
     roads: List[RoadEmbedded] = []
     
     # Create a central hub (first location, usually government/admin)
     if locations:
-        hub_location = locations[0]
-        
-        # Connect hub to first building of each other zone (main roads)
-        zone_representatives = {}
-        for loc in locations:
-            if loc.zone not in zone_representatives:
-                zone_representatives[loc.zone] = loc
-        
-        for zone, representative in zone_representatives.items():
-            if representative.id != hub_location.id:
-                distance = calculate_distance(hub_location.position, representative.position)
-                road_id = f"r_main_{hub_location.id}_{representative.id}"
-                
-                roads.append(RoadEmbedded(
-                    id=road_id,
-                    from_location=hub_location.id,
-                    to_location=representative.id,
-                    distance=round(distance, 2),
-                    type="main"
-                ))
+        hub_idx = 0
+        location_ids = [loc.id for loc in locations]
         
-        # Connect buildings within same zone (secondary roads)
-        zones_dict: Dict[str, List[LocationEmbedded]] = {}
-        for loc in locations:
-            if loc.zone not in zones_dict:
-                zones_dict[loc.zone] = []
-            zones_dict[loc.zone].append(loc)
+        # Road endpoints as (from index, to index, type), distances are gathered afterwards
+        # Main roads: hub to the first building of each other zone
+        pairs: List[Tuple[int, int, str]] = [
+            (hub_idx, rep_idx, "main")
+            for rep_idx in zone_representatives.values()
+            if rep_idx != hub_idx
+        ]
+        # Secondary roads: consecutive buildings within each zone
+        pairs += [
+            (idx1, idx2, "secondary")
+            for zone_indices in zones_dict.values()
+            for idx1, idx2 in zip(zone_indices, zone_indices[1:])
+        ]
         
-        for zone, zone_locations in zones_dict.items():
-            if len(zone_locations) > 1:
-                # Connect consecutive buildings in the zone
-                for i in range(len(zone_locations) - 1):
-                    loc1 = zone_locations[i]
-                    loc2 = zone_locations[i + 1]
-                    distance = calculate_distance(loc1.position, loc2.position)
-                    road_id = f"r_sec_{loc1.id}_{loc2.id}"
-                    
-                    roads.append(RoadEmbedded(
-                        id=road_id,
-                        from_location=loc1.id,
-                        to_location=loc2.id,
-                        distance=round(distance, 2),
-                        type="secondary"
-                    ))
+        if pairs:
+            # Distances for just the road endpoints, in one vectorized pass
+            points = np.array(positions, dtype=np.float64)
+            from_idx = np.array([pair[0] for pair in pairs])
+            to_idx = np.array([pair[1] for pair in pairs])
+            deltas = points[from_idx] - points[to_idx]
+            distances = np.sqrt((deltas * deltas).sum(axis=1))
+            # Half-up to two decimals (distances are non-negative), cheaper than round-half-even
+            distances = (np.floor(distances * 100.0 + 0.5) / 100.0).tolist()
+            
+            # Ids, types and distances are all generated here, so skip validation
+            roads = [
+                RoadEmbedded.model_construct(
+                    id=f"{_ROAD_ID_PREFIX[road_type]}_{location_ids[idx1]}_{location_ids[idx2]}",
+                    from_location=location_ids[idx1],
+                    to_location=location_ids[idx2],
+                    distance=distance,
+                    type=road_type
+                )
+                for (idx1, idx2, road_type), distance in zip(pairs, distances)
+            ]
     
     return locations, roads
@@ -1,25 +1,67 @@
 """Pytest configuration and shared fixtures"""
+import asyncio
+import os
+
+# Load .env.test, never the real .env: must happen before anything imports app settings
+os.environ["TESTING"] = "1"
+
 import pytest
 import pytest_asyncio
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Callable, Iterator, Mapping, Tuple
+from fastapi import FastAPI
 from httpx import AsyncClient, ASGITransport
-from beanie import init_beanie
+from beanie import PydanticObjectId, init_beanie
 from motor.motor_asyncio import AsyncIOMotorClient
 from datetime import timedelta
 
 from app.main import app
-from app.core.security import create_access_token, get_password_hash
+from app.api.deps import _USER_CACHE, issue_access_token
+from app.core.security import get_password_hash
 from app.models.user import User
-from app.models.project import Project
+from app.models.project import Project, ModelType
 from app.core.config import settings
 
 
-@pytest_asyncio.fixture
-async def test_db():
-    """Initialize test database connection"""
-    # Use test database
+# bcrypt is deliberately slow, hash the shared test password once per session
+_TEST_PW_HASH = get_password_hash("testpassword123")
+
+# Fixed ids of the users seeded once per session (per-test cleanup keeps them)
+_TEST_USER_ID = PydanticObjectId("65a1f0c2e4b0a1b2c3d4e501")
+_TEST_USER_2_ID = PydanticObjectId("65a1f0c2e4b0a1b2c3d4e502")
+
+
+def _make_user(user_id: PydanticObjectId, email: str) -> User:
+    """Build (without saving) an active test user with the shared password"""
+    return User(id=user_id, email=email, hashed_password=_TEST_PW_HASH, is_active=True)
+
+
+def pytest_asyncio_loop_factories(
+    config: pytest.Config, item: pytest.Item
+) -> Mapping[str, Callable[[], asyncio.AbstractEventLoop]]:
+    """Run the async tests on uvloop where it is installed (it isn't on Windows)"""
+    try:
+        import uvloop
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest_asyncio.fixture(scope="session")
+async def _session_db():
+    """Initialize the test database and Beanie once for the whole session"""
+    # Use test database (from .env.test, point it at an in-memory/tmpfs mongod to skip disk I/O)
+    test_db_name = settings.DATABASE_NAME
+    
+    # Each pytest-xdist worker gets its own database so parallel truncation can't collide
+    worker_id = os.getenv("PYTEST_XDIST_WORKER")
+    if worker_id:
+        test_db_name = f"{test_db_name}_{worker_id}"
+    
+    # Tests truncate and finally drop this database, so never touch one that isn't a test database
+    if not test_db_name.startswith("test_"):
+        pytest.exit(f"Refusing to run against non-test database {test_db_name!r}", returncode=1)
+    
     client = AsyncIOMotorClient(settings.MONGODB_URL)
-    test_db_name = "test_city_planner"
     
     # Initialize Beanie with test database
     await init_beanie(
@@ -29,70 +71,116 @@ async def test_db():
     
     yield
     
-    # Cleanup: Drop test database after tests
+    # Cleanup: Drop test database after the session
     await client.drop_database(test_db_name)
     client.close()
 
 
 @pytest_asyncio.fixture
-async def async_client(test_db) -> AsyncGenerator[AsyncClient, None]:
-    """Create async HTTP client for testing"""
-    transport = ASGITransport(app=app)
+async def test_db(_session_db):
+    """Per-test database access; collections are emptied after each test"""
+    yield
+    
+    # Truncate instead of dropping so Beanie and the indexes are initialized only once;
+    # the session's seeded users are kept
+    await Project.get_pymongo_collection().delete_many({})
+    await User.get_pymongo_collection().delete_many({"_id": {"$nin": [_TEST_USER_ID, _TEST_USER_2_ID]}})
+    
+    # Tests may change users, so cached token lookups must not leak into the next test
+    _USER_CACHE.clear()
+
+
+@pytest.fixture(scope="session")
+def test_app() -> Iterator[FastAPI]:
+    """The application under test, built once at import and shared by every test"""
+    yield app
+    
+    # Tests customise the shared app through dependency overrides, never by rebuilding it
+    app.dependency_overrides.clear()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_client(_session_db, test_app: FastAPI) -> AsyncGenerator[AsyncClient, None]:
+    """Create async HTTP client for testing (in-process ASGI calls, no socket; shared across the session)"""
+    transport = ASGITransport(app=test_app)
     async with AsyncClient(transport=transport, base_url="http://test") as client:
         yield client
 
 
-@pytest_asyncio.fixture
-async def test_user(test_db) -> User:
-    """Create a test user in the database"""
-    user = User(
-        email="test@example.com",
-        hashed_password=get_password_hash("testpassword123"),
-        is_active=True
-    )
-    await user.insert()
-    return user
+@pytest_asyncio.fixture(scope="session")
+async def unauthenticated_client(test_app: FastAPI) -> AsyncGenerator[AsyncClient, None]:
+    """Client for requests rejected by auth, no database setup needed"""
+    transport = ASGITransport(app=test_app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
 
 
-@pytest_asyncio.fixture
-async def test_user_2(test_db) -> User:
-    """Create a second test user for ownership tests"""
-    user = User(
-        email="test2@example.com",
-        hashed_password=get_password_hash("testpassword123"),
-        is_active=True
+@pytest_asyncio.fixture(scope="session")
+async def _seeded_users(_session_db) -> Tuple[User, User]:
+    """Insert the two test users once per session (test_db cleanup keeps them)"""
+    users = (
+        _make_user(_TEST_USER_ID, "test@example.com"),
+        _make_user(_TEST_USER_2_ID, "test2@example.com")
     )
-    await user.insert()
-    return user
+    
+    # A previous session that died before its teardown may have left these rows behind
+    await User.get_pymongo_collection().delete_many({
+        "$or": [
+            {"_id": {"$in": [user.id for user in users]}},
+            {"email": {"$in": [user.email for user in users]}}
+        ]
+    })
+    await User.insert_many(list(users))
+    return users
 
 
 @pytest.fixture
-def auth_token(test_user: User) -> str:
-    """Generate JWT token for test user"""
-    access_token = create_access_token(
-        data={"sub": test_user.email},
-        expires_delta=timedelta(minutes=30)
-    )
-    return access_token
+def test_user(test_db, _seeded_users: Tuple[User, User]) -> User:
+    """The test user, already in the database"""
+    return _seeded_users[0]
 
 
 @pytest.fixture
-def auth_token_user_2(test_user_2: User) -> str:
-    """Generate JWT token for second test user"""
-    access_token = create_access_token(
-        data={"sub": test_user_2.email},
-        expires_delta=timedelta(minutes=30)
-    )
-    return access_token
+def test_user_2(test_db, _seeded_users: Tuple[User, User]) -> User:
+    """A second test user for ownership tests, already in the database"""
+    return _seeded_users[1]
+
+
+@pytest_asyncio.fixture(scope="session")
+async def auth_token(_seeded_users: Tuple[User, User]) -> str:
+    """Generate JWT token (with an active session) for test user, once per session"""
+    return await issue_access_token(_seeded_users[0], expires_delta=timedelta(minutes=30))
+
+
+@pytest_asyncio.fixture(scope="session")
+async def auth_token_user_2(_seeded_users: Tuple[User, User]) -> str:
+    """Generate JWT token (with an active session) for second test user, once per session"""
+    return await issue_access_token(_seeded_users[1], expires_delta=timedelta(minutes=30))
 
 
 @pytest.fixture
-def auth_headers(auth_token: str) -> dict:
-    """Create authorization headers with JWT token"""
+def auth_headers(auth_token: str, test_user: User) -> dict:
+    """Create authorization headers with JWT token (the token's user row exists for the test)"""
     return {"Authorization": f"Bearer {auth_token}"}
 
 
 @pytest.fixture
-def auth_headers_user_2(auth_token_user_2: str) -> dict:
-    """Create authorization headers for second user"""
+def auth_headers_user_2(auth_token_user_2: str, test_user_2: User) -> dict:
+    """Create authorization headers for second user (the token's user row exists for the test)"""
     return {"Authorization": f"Bearer {auth_token_user_2}"}
+
+
+@pytest_asyncio.fixture
+async def generated_project(test_user: User) -> Project:
+    """Insert a lean project owned by the test user (CRUD tests never read locations/roads, so nothing is generated)"""
+    project = Project(
+        name="Test Project",
+        description="Test description",
+        model_type=ModelType.PLANNING,
+        sectors=["government"],
+        user_id=test_user.id_str,
+        locations=[],
+        roads=[]
+    )
+    await project.insert()
+    return project
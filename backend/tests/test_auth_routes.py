@@ -0,0 +1,176 @@
+"""Unit tests for authentication API routes"""
+import asyncio
+import time
+import pytest
+from fakeredis.aioredis import FakeRedis
+from httpx import AsyncClient
+from jose import jwt
+
+from app.api.routes import auth
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.db import sessions
+from app.models.user import User
+
+NEW_USER = {"email": "new@example.com", "password": "newpassword123"}
+
+
+class TestSessions:
+    """Test that every token is backed by a revocable session"""
+    
+    async def test_register_login_me_logout(self, async_client: AsyncClient, test_db):
+        """Test the full lifecycle: a logged-out token is rejected right away"""
+        response = await async_client.post("/api/auth/register", json=NEW_USER)
+        assert response.status_code == 201
+        
+        response = await async_client.post("/api/auth/token", json=NEW_USER)
+        assert response.status_code == 200
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        
+        response = await async_client.get("/api/auth/me", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["email"] == NEW_USER["email"]
+        
+        response = await async_client.post("/api/auth/logout", headers=headers)
+        assert response.status_code == 200
+        
+        # The /me above cached the user, logout must still take effect immediately
+        response = await async_client.get("/api/auth/me", headers=headers)
+        assert response.status_code == 401
+        assert response.json()["detail"] == "Could not validate credentials"
+    
+    @pytest.mark.parametrize("with_jti", [True, False], ids=["unknown_jti", "missing_jti"])
+    async def test_token_without_session(self, async_client: AsyncClient, test_user: User, with_jti: bool):
+        """Test that a validly signed token is rejected unless it has an active session"""
+        if with_jti:
+            # Signed like a real token, but never registered through issue_access_token
+            token = create_access_token(data={"sub": test_user.email})
+        else:
+            token = jwt.encode({"sub": test_user.email}, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+        
+        response = await async_client.get("/api/auth/me", headers={"Authorization": f"Bearer {token}"})
+        
+        assert response.status_code == 401
+        assert response.json()["detail"] == "Could not validate credentials"
+    
+    async def test_redis_session_store(self, async_client: AsyncClient, test_user: User, monkeypatch):
+        """Test that sessions are stored in and revoked from Redis when it is configured"""
+        redis = FakeRedis(decode_responses=True)
+        monkeypatch.setattr(sessions, "redis_client", redis)
+        
+        response = await async_client.post(
+            "/api/auth/token",
+            json={"email": test_user.email, "password": "testpassword123"}
+        )
+        assert response.status_code == 200
+        token = response.json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        
+        key = f"sess:{jwt.get_unverified_claims(token)['jti']}"
+        assert await redis.get(key) == test_user.id_str
+        assert 0 < await redis.ttl(key) <= settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        
+        response = await async_client.get("/api/auth/me", headers=headers)
+        assert response.status_code == 200
+        
+        response = await async_client.post("/api/auth/logout", headers=headers)
+        assert response.status_code == 200
+        assert await redis.get(key) is None
+        
+        response = await async_client.get("/api/auth/me", headers=headers)
+        assert response.status_code == 401
+        await redis.aclose()
+    
+    async def test_redis_required_outside_debug(self, monkeypatch):
+        """Test that startup refuses the in-process store unless DEBUG or TESTING is set"""
+        monkeypatch.setattr(settings, "REDIS_URL", None)
+        monkeypatch.setattr(settings, "DEBUG", False)
+        monkeypatch.delenv("TESTING")
+        
+        with pytest.raises(RuntimeError, match="REDIS_URL"):
+            await sessions.connect_to_redis()
+
+
+class TestRegister:
+    """Test the registration endpoint"""
+    
+    async def test_register_duplicate_email(self, async_client: AsyncClient, test_db):
+        """Test that registering an existing email is rejected by the unique index"""
+        response = await async_client.post("/api/auth/register", json=NEW_USER)
+        assert response.status_code == 201
+        
+        response = await async_client.post("/api/auth/register", json=NEW_USER)
+        
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Email already registered"
+
+
+class TestLogin:
+    """Test the login endpoint"""
+    
+    async def test_login_inactive_user(self, async_client: AsyncClient, test_db, monkeypatch):
+        """Test that an inactive account gets the generic 401 without a bcrypt verify"""
+        response = await async_client.post("/api/auth/register", json={**NEW_USER, "is_active": False})
+        assert response.status_code == 201
+        
+        def fail_verify(plain_password: str, hashed_password: str) -> bool:
+            raise AssertionError("verify_password called for an inactive user")
+        
+        monkeypatch.setattr(auth, "verify_password", fail_verify)
+        
+        response = await async_client.post("/api/auth/token", json=NEW_USER)
+        
+        assert response.status_code == 401
+        assert response.json()["detail"] == "Incorrect email or password"
+    
+    async def test_concurrent_identical_logins_share_verify(
+        self,
+        async_client: AsyncClient,
+        test_user: User,
+        monkeypatch
+    ):
+        """Test that simultaneous identical logins run one bcrypt verify but get their own tokens"""
+        calls = []
+        verify_password = auth.verify_password
+        
+        def counting_verify(plain_password: str, hashed_password: str) -> bool:
+            calls.append(plain_password)
+            # Runs in the threadpool: hold the check open so the other requests join it
+            time.sleep(0.1)
+            return verify_password(plain_password, hashed_password)
+        
+        monkeypatch.setattr(auth, "verify_password", counting_verify)
+        
+        credentials = {"email": test_user.email, "password": "testpassword123"}
+        responses = await asyncio.gather(*(
+            async_client.post("/api/auth/token", json=credentials) for _ in range(5)
+        ))
+        
+        assert [response.status_code for response in responses] == [200] * 5
+        assert len(calls) == 1
+        assert len({response.json()["access_token"] for response in responses}) == 5
+        assert not auth._login_inflight
+    
+    async def test_concurrent_logins_different_passwords(
+        self,
+        async_client: AsyncClient,
+        test_user: User,
+        monkeypatch
+    ):
+        """Test that a wrong and a right password for the same email never share a result"""
+        verify_password = auth.verify_password
+        
+        def slow_verify(plain_password: str, hashed_password: str) -> bool:
+            time.sleep(0.1)
+            return verify_password(plain_password, hashed_password)
+        
+        monkeypatch.setattr(auth, "verify_password", slow_verify)
+        
+        wrong, right = await asyncio.gather(
+            async_client.post("/api/auth/token", json={"email": test_user.email, "password": "wrongpassword"}),
+            async_client.post("/api/auth/token", json={"email": test_user.email, "password": "testpassword123"})
+        )
+        
+        assert wrong.status_code == 401
+        assert right.status_code == 200
+        assert not auth._login_inflight
@@ -1,5 +1,6 @@
 """Unit tests for project generation service"""
 import pytest
+from pydantic import ValidationError
 from app.services.project_generator import (
     generate_project_layout,
     generate_radial_positions,
@@ -8,7 +9,7 @@ from app.services.project_generator import (
     CORPORATE_ZONE_TEMPLATES
 )
 from app.models.project import ModelType
-from app.models.location import LocationPosition
+from app.models.location import LocationEmbedded, LocationPosition
 
 
 class TestRadialPositionGeneration:
@@ -193,6 +194,22 @@ class TestProjectLayoutGeneration:
         assert "healthcare" in generated_zones
         assert "invalid_zone" not in generated_zones
     
+    def test_duplicate_sectors(self):
+        """Test repeated sectors generate a single zone each"""
+        locations, _ = generate_project_layout(
+            model_type=ModelType.PLANNING,
+            sectors=["government", "healthcare", "government"]
+        )
+        
+        # Same layout as the deduplicated input, with unique location ids
+        expected, _ = generate_project_layout(
+            model_type=ModelType.PLANNING,
+            sectors=["government", "healthcare"]
+        )
+        location_ids = [loc.id for loc in locations]
+        assert location_ids == [loc.id for loc in expected]
+        assert len(set(location_ids)) == len(location_ids)
+    
     def test_all_city_sectors(self):
         """Test generation with all available city sectors"""
         all_sectors = list(CITY_ZONE_TEMPLATES.keys())
@@ -265,3 +282,24 @@ class TestProjectLayoutGeneration:
         assert zone_counts.get("government", 0) == 2
         # Healthcare has 2 buildings in template
         assert zone_counts.get("healthcare", 0) == 2
+
+
+class TestLocationModel:
+    """Test stored location positions"""
+    
+    LOCATION = {"id": "loc_0", "name": "City Hall", "type": "Government"}
+    
+    @pytest.mark.parametrize("position", [
+        {"x": 1, "y": 2, "z": 3},
+        [1, 2, 3]
+    ], ids=["legacy_dict", "list"])
+    def test_position_formats(self, position):
+        """Test legacy {x, y, z} documents load as [x, y, z] lists"""
+        location = LocationEmbedded.model_validate({**self.LOCATION, "position": position})
+        assert location.position == [1.0, 2.0, 3.0]
+    
+    @pytest.mark.parametrize("position", [[1, 2], [1, 2, 3, 4]], ids=["too_short", "too_long"])
+    def test_invalid_position_length(self, position):
+        """Test positions must have exactly three coordinates"""
+        with pytest.raises(ValidationError):
+            LocationEmbedded.model_validate({**self.LOCATION, "position": position})
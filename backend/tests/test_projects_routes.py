@@ -1,67 +1,69 @@
 """Unit tests for project API routes"""
 import pytest
+from types import MappingProxyType
 from httpx import AsyncClient
 from app.models.user import User
-from app.models.project import Project, ModelType
+from app.models.project import Project, ProjectResponse, ModelType
+
+# Read-only request payload shared by the tests; copy with {**BASE_PROJECT, ...} to vary it
+BASE_PROJECT = MappingProxyType({
+    "name": "Test City",
+    "description": "Test description",
+    "model_type": "planning",
+    "sectors": ("government", "healthcare")
+})
 
 
 class TestProjectGeneration:
     """Test project generation endpoint"""
     
-    @pytest.mark.asyncio
-    async def test_generate_project_without_token(self, async_client: AsyncClient):
-        """Test that project generation fails without JWT token"""
-        project_data = {
-            "name": "Test City",
-            "description": "Test description",
-            "model_type": "planning",
-            "sectors": ["government", "healthcare"]
-        }
-        
-        response = await async_client.post("/api/projects/generate", json=project_data)
-        
-        # Should return 401 Unauthorized without token
-        assert response.status_code == 401
-        assert "Not authenticated" in response.text or "Unauthorized" in response.text
-    
-    @pytest.mark.asyncio
-    async def test_generate_project_with_invalid_token(self, async_client: AsyncClient):
-        """Test that project generation fails with invalid JWT token"""
-        project_data = {
-            "name": "Test City",
-            "description": "Test description",
-            "model_type": "planning",
-            "sectors": ["government", "healthcare"]
-        }
-        
-        headers = {"Authorization": "Bearer invalid_token_12345"}
-        response = await async_client.post(
-            "/api/projects/generate",
-            json=project_data,
+    @pytest.mark.parametrize("headers, detail", [
+        (None, "Not authenticated"),
+        ({"Authorization": "Bearer invalid_token_12345"}, "Could not validate credentials")
+    ], ids=["without_token", "invalid_token"])
+    async def test_generate_project_unauthenticated(
+        self,
+        unauthenticated_client: AsyncClient,
+        headers: dict,
+        detail: str
+    ):
+        """Test that project generation fails without a valid JWT token"""
+        response = await unauthenticated_client.post(
+            "/api/v1/projects/generate",
+            json={**BASE_PROJECT},
             headers=headers
         )
         
-        # Should return 401 Unauthorized with invalid token
+        # Should return 401 Unauthorized before reaching the database
         assert response.status_code == 401
+        assert response.json()["detail"] == detail
     
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize("project_data", [
+        {
+            **BASE_PROJECT,
+            "name": "Test City Planning",
+            "description": "A test city with multiple zones",
+            "sectors": ("government", "healthcare", "education"),
+            "theme": "modern"
+        },
+        {
+            **BASE_PROJECT,
+            "name": "Corporate Campus",
+            "description": "Modern corporate headquarters",
+            "model_type": "corporate",
+            "sectors": ("admin", "research", "cafeteria")
+        }
+    ], ids=["planning", "corporate"])
     async def test_generate_project_success(
         self,
         async_client: AsyncClient,
         auth_headers: dict,
-        test_user: User
+        test_user: User,
+        project_data: dict
     ):
-        """Test successful project generation with valid token"""
-        project_data = {
-            "name": "Test City Planning",
-            "description": "A test city with multiple zones",
-            "model_type": "planning",
-            "sectors": ["government", "healthcare", "education"],
-            "theme": "modern"
-        }
-        
+        """Test successful city and corporate campus generation with valid token"""
         response = await async_client.post(
-            "/api/projects/generate",
+            "/api/v1/projects/generate",
             json=project_data,
             headers=auth_headers
         )
@@ -69,136 +71,87 @@ class TestProjectGeneration:
         # Should return 201 Created
         assert response.status_code == 201
         
-        data = response.json()
+        # Validate against the response schema (checks every field and nested location/road)
+        project = ProjectResponse.model_validate(response.json())
         
         # Verify response structure
-        assert data["name"] == "Test City Planning"
-        assert data["description"] == "A test city with multiple zones"
-        assert data["model_type"] == "planning"
-        assert data["user_id"] == str(test_user.id)
+        assert project.name == project_data["name"]
+        assert project.description == project_data["description"]
+        assert project.model_type == project_data["model_type"]
+        assert project.user_id == test_user.id_str
         
-        # Verify locations were generated
-        assert "locations" in data
-        assert len(data["locations"]) > 0
+        # Verify locations and roads were generated
+        assert len(project.locations) > 0
+        assert len(project.roads) > 0
         
-        # Verify roads were generated
-        assert "roads" in data
-        assert len(data["roads"]) > 0
-        
-        # Verify each location has required fields
-        for location in data["locations"]:
-            assert "id" in location
-            assert "name" in location
-            assert "type" in location
-            assert "position" in location
-            assert "zone" in location
-            assert location["zone"] in project_data["sectors"]
+        # Only requested zones appear
+        assert {location.zone for location in project.locations} <= set(project_data["sectors"])
     
-    @pytest.mark.asyncio
     async def test_generate_project_without_sectors(
         self,
         async_client: AsyncClient,
         auth_headers: dict
     ):
         """Test that project generation fails without sectors"""
-        project_data = {
-            "name": "Test City",
-            "description": "Test description",
-            "model_type": "planning",
-            "sectors": []  # Empty sectors
-        }
+        project_data = {**BASE_PROJECT, "sectors": []}  # Empty sectors
         
         response = await async_client.post(
-            "/api/projects/generate",
+            "/api/v1/projects/generate",
             json=project_data,
             headers=auth_headers
         )
         
-        # Should return 400 Bad Request
-        assert response.status_code == 400
-    
-    @pytest.mark.asyncio
-    async def test_generate_corporate_project(
-        self,
-        async_client: AsyncClient,
-        auth_headers: dict
-    ):
-        """Test corporate campus generation"""
-        project_data = {
-            "name": "Corporate Campus",
-            "description": "Modern corporate headquarters",
-            "model_type": "corporate",
-            "sectors": ["admin", "research", "cafeteria"]
-        }
-        
-        response = await async_client.post(
-            "/api/projects/generate",
-            json=project_data,
-            headers=auth_headers
-        )
-        
-        assert response.status_code == 201
-        data = response.json()
-        
-        # Verify corporate-specific sectors
-        assert data["model_type"] == "corporate"
-        location_zones = [loc["zone"] for loc in data["locations"]]
-        assert "admin" in location_zones or "research" in location_zones
+        # ProjectCreate requires at least one sector, so validation rejects it (422)
+        assert response.status_code == 422
 
 
 class TestProjectCRUD:
     """Test project CRUD operations"""
     
-    @pytest.mark.asyncio
     async def test_list_projects(
         self,
         async_client: AsyncClient,
         auth_headers: dict,
-        test_user: User
+        generated_project: Project
     ):
         """Test listing user's projects"""
-        # Create a test project first
-        project_data = {
-            "name": "My City",
-            "description": "Test",
-            "model_type": "planning",
-            "sectors": ["government"]
-        }
-        await async_client.post(
-            "/api/projects/generate",
-            json=project_data,
-            headers=auth_headers
-        )
-        
         # List projects
-        response = await async_client.get("/api/projects/", headers=auth_headers)
+        response = await async_client.get("/api/v1/projects/", headers=auth_headers)
         
         assert response.status_code == 200
         data = response.json()
         assert isinstance(data, list)
-        assert len(data) >= 1
+        # Collections are emptied between tests, so only this test's project is listed
+        assert len(data) == 1
+        assert data[0]["id"] == str(generated_project.id)
+    
+    async def test_get_project_non_owner(
+        self,
+        async_client: AsyncClient,
+        auth_headers: dict,
+        auth_headers_user_2: dict,
+        generated_project: Project
+    ):
+        """Test that another user's project reads as missing (404)"""
+        project_url = f"/api/v1/projects/{generated_project.id}"
+        
+        # The owner can read it, so the 404 below comes from ownership scoping
+        owner_response = await async_client.get(project_url, headers=auth_headers)
+        assert owner_response.status_code == 200
+        assert owner_response.json()["id"] == str(generated_project.id)
+        
+        response = await async_client.get(project_url, headers=auth_headers_user_2)
+        
+        assert response.status_code == 404
     
-    @pytest.mark.asyncio
     async def test_update_project_owner(
         self,
         async_client: AsyncClient,
         auth_headers: dict,
-        test_user: User
+        generated_project: Project
     ):
         """Test that project owner can update their project"""
-        # Create project
-        project_data = {
-            "name": "Original Name",
-            "description": "Original Description",
-            "model_type": "planning",
-            "sectors": ["government"]
-        }
-        create_response = await async_client.post(
-            "/api/projects/generate",
-            json=project_data,
-            headers=auth_headers
-        )
-        project_id = create_response.json()["id"]
+        project_id = str(generated_project.id)
         
         # Update project
         update_data = {
@@ -206,7 +159,7 @@ class TestProjectCRUD:
             "description": "Updated Description"
         }
         response = await async_client.put(
-            f"/api/projects/{project_id}",
+            f"/api/v1/projects/{project_id}",
             json=update_data,
             headers=auth_headers
         )
@@ -216,105 +169,80 @@ class TestProjectCRUD:
         assert data["name"] == "Updated Name"
         assert data["description"] == "Updated Description"
     
-    @pytest.mark.asyncio
     async def test_update_project_non_owner(
         self,
         async_client: AsyncClient,
-        auth_headers: dict,
         auth_headers_user_2: dict,
-        test_user: User,
-        test_user_2: User
+        generated_project: Project
     ):
-        """Test that non-owner cannot update project (403 Forbidden)"""
-        # User 1 creates project
-        project_data = {
-            "name": "User 1 Project",
-            "description": "Created by user 1",
-            "model_type": "planning",
-            "sectors": ["government"]
-        }
-        create_response = await async_client.post(
-            "/api/projects/generate",
-            json=project_data,
-            headers=auth_headers
-        )
-        project_id = create_response.json()["id"]
+        """Test that non-owner cannot update project (404, indistinguishable from missing)"""
+        # Project belongs to user 1
+        project_id = str(generated_project.id)
         
         # User 2 tries to update
         update_data = {"name": "Hacked Name"}
         response = await async_client.put(
-            f"/api/projects/{project_id}",
+            f"/api/v1/projects/{project_id}",
             json=update_data,
             headers=auth_headers_user_2  # Different user's token
         )
         
-        # Should return 403 Forbidden
-        assert response.status_code == 403
-        assert "Not authorized" in response.json()["detail"]
+        # Should return 404 Not Found, and the project must be unchanged
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Project not found"
+        stored = await Project.get(generated_project.id)
+        assert stored.name == generated_project.name
     
-    @pytest.mark.asyncio
-    async def test_delete_project_owner(
+    async def test_update_project_malformed_id(
         self,
         async_client: AsyncClient,
         auth_headers: dict
     ):
-        """Test that project owner can delete their project"""
-        # Create project
-        project_data = {
-            "name": "To Delete",
-            "description": "This will be deleted",
-            "model_type": "planning",
-            "sectors": ["government"]
-        }
-        create_response = await async_client.post(
-            "/api/projects/generate",
-            json=project_data,
+        """Test that a malformed project id is a 404, not a server error"""
+        response = await async_client.put(
+            "/api/v1/projects/not-an-object-id",
+            json={"name": "Renamed"},
             headers=auth_headers
         )
-        project_id = create_response.json()["id"]
+        
+        assert response.status_code == 404
+    
+    async def test_delete_project_owner(
+        self,
+        async_client: AsyncClient,
+        auth_headers: dict,
+        generated_project: Project
+    ):
+        """Test that project owner can delete their project"""
+        project_id = str(generated_project.id)
         
         # Delete project
         response = await async_client.delete(
-            f"/api/projects/{project_id}",
+            f"/api/v1/projects/{project_id}",
             headers=auth_headers
         )
         
         assert response.status_code == 204
         
-        # Verify project is deleted
-        get_response = await async_client.get(
-            f"/api/projects/{project_id}",
-            headers=auth_headers
-        )
-        assert get_response.status_code == 404
+        # Verify project is deleted (straight from the database, no extra request)
+        assert await Project.get(generated_project.id) is None
     
-    @pytest.mark.asyncio
     async def test_delete_project_non_owner(
         self,
         async_client: AsyncClient,
-        auth_headers: dict,
-        auth_headers_user_2: dict
+        auth_headers_user_2: dict,
+        generated_project: Project
     ):
-        """Test that non-owner cannot delete project (403 Forbidden)"""
-        # User 1 creates project
-        project_data = {
-            "name": "Protected Project",
-            "description": "Cannot be deleted by others",
-            "model_type": "planning",
-            "sectors": ["government"]
-        }
-        create_response = await async_client.post(
-            "/api/projects/generate",
-            json=project_data,
-            headers=auth_headers
-        )
-        project_id = create_response.json()["id"]
+        """Test that non-owner cannot delete project (404, indistinguishable from missing)"""
+        # Project belongs to user 1
+        project_id = str(generated_project.id)
         
         # User 2 tries to delete
         response = await async_client.delete(
-            f"/api/projects/{project_id}",
+            f"/api/v1/projects/{project_id}",
             headers=auth_headers_user_2
         )
         
-        # Should return 403 Forbidden
-        assert response.status_code == 403
+        # Should return 404 Not Found, and the project must survive
+        assert response.status_code == 404
+        assert await Project.get(generated_project.id) is not None